@@ -76,11 +76,9 @@ class GlibcSelfTestBase(OESelftestTestCase, OEPTestResultTestCase):
             status, _ = qemu.run("uname")
             self.assertEqual(status, 0)
 
-            # setup nfs mount
-            if qemu.run("mkdir -p \"{0}\"".format(tmpdir))[0] != 0:
-                raise Exception("Failed to setup NFS mount directory on target")
+            # setup nfs mount, creating the mount point in the same ssh session
             mountcmd = "mount -o noac,nfsvers=3,local_lock=all,port={0},mountport={1} \"{2}:{3}\" \"{3}\"".format(nfsport, mountport, qemu.server_ip, tmpdir)
-            status, output = qemu.run(mountcmd)
+            status, output = qemu.run("mkdir -p \"{0}\" && {1}".format(tmpdir, mountcmd))
             if status != 0:
                 raise Exception("Failed to setup NFS mount on target ({})".format(repr(output)))
 